@@ -28,14 +28,32 @@ import logging
 import os
 import re
 import sys
-from collections import OrderedDict
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
 from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+try:
+    # Optional: google-re2 compiles to a DFA – linear-time scanning with a
+    # lower constant than the stdlib regex VM, and immune to pathological
+    # backtracking input. Falls back to stdlib re when not installed.
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+try:
+    # Optional: msgspec decodes JSON several times faster than stdlib json –
+    # used for the REST response parsing on the message hot path.
+    import msgspec.json as _msgspec_json
+    _json_loads = _msgspec_json.decode
+except ImportError:
+    _json_loads = json.loads
 
 import aiohttp
 import discord
 from discord.ext import commands
-from dotenv import load_dotenv, set_key, dotenv_values
+from dotenv import load_dotenv, dotenv_values
 import stoat
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -248,9 +266,12 @@ def interactive_env_setup() -> None:
         print()
 
     # ── 4. Write / update the .env file ─────────────────────────────────────
-    ENV_FILE.touch(exist_ok=True)
-    for key, value in existing.items():
-        set_key(str(ENV_FILE), key, value)
+    # One write of the whole mapping – set_key() re-reads and rewrites the
+    # entire file per key, and a crash mid-loop would leave it half-updated.
+    with ENV_FILE.open("w", encoding="utf-8") as f:
+        for key, value in existing.items():
+            escaped = (value or "").replace("\\", "\\\\").replace('"', '\\"')
+            f.write(f'{key}="{escaped}"\n')
 
     print(f"  ✔  Configuration saved to {ENV_FILE.resolve()}")
     print(f"{banner}\n")
@@ -278,6 +299,13 @@ REVOLT_API_URL = os.getenv("REVOLT_API_URL", "https://api.revolt.chat").rstrip("
 REVOLT_WS_URL  = os.getenv("REVOLT_WS_URL",  "wss://ws.revolt.chat").rstrip("/")
 REVOLT_CDN_URL = os.getenv("REVOLT_CDN_URL", "https://autumn.revolt.chat").rstrip("/")
 
+# Hot-path constants – build the URL prefixes once instead of a fresh
+# f-string per outbound request. (The bot-token auth header lives on the
+# ClientSession as a default, see StoatBot.on_ready.)
+_REVOLT_CHANNELS_URL = f"{REVOLT_API_URL}/channels"
+_REVOLT_USERS_URL    = f"{REVOLT_API_URL}/users"
+_REVOLT_EMOJI_URL    = f"{REVOLT_API_URL}/custom/emoji"
+
 if len(DISCORD_CHANNEL_IDS) != len(STOAT_CHANNEL_IDS):
     raise RuntimeError(
         f"Channel list length mismatch: "
@@ -307,6 +335,10 @@ DISCORD_TO_STOAT: dict[int, str] = {
     if dir_ in ("bi", "discord")
 }
 
+# Frozenset views for the per-event membership gates in the hot handlers.
+_BRIDGED_DISCORD_IDS = frozenset(DISCORD_TO_STOAT)
+_BRIDGED_STOAT_IDS   = frozenset(STOAT_TO_DISCORD)
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  WELCOME DM TOGGLE
 # ──────────────────────────────────────────────────────────────────────────────
@@ -335,7 +367,7 @@ logger = logging.getLogger("bridge")
 
 NOTIFIED_USERS_FILE = ENV_FILE.parent / "notified_users.json"
 
-_notified_users: dict[str, list[str]] = {"discord": [], "stoat": []}
+_notified_users: dict[str, set[str]] = {"discord": set(), "stoat": set()}
 
 
 def _load_notified_users() -> None:
@@ -344,8 +376,8 @@ def _load_notified_users() -> None:
         try:
             with NOTIFIED_USERS_FILE.open("r", encoding="utf-8") as f:
                 data = json.load(f)
-                _notified_users["discord"] = list(data.get("discord", []))
-                _notified_users["stoat"]   = list(data.get("stoat", []))
+                _notified_users["discord"] = set(data.get("discord", []))
+                _notified_users["stoat"]   = set(data.get("stoat", []))
             logger.info(
                 f"Loaded {len(_notified_users['discord'])} Discord "
                 f"and {len(_notified_users['stoat'])} Stoat notified users."
@@ -354,12 +386,57 @@ def _load_notified_users() -> None:
             logger.error(f"Could not load {NOTIFIED_USERS_FILE}: {exc}")
 
 
-def _save_notified_users() -> None:
+def _notified_snapshot() -> dict[str, list[str]]:
+    # Taken on the event-loop thread: handlers may add() to the live sets
+    # while the writer thread runs, and iterating them there would race.
+    # Clearing the dirty flag here (not after the write) means a mark that
+    # lands while the write is in flight re-dirties and triggers another save
+    # instead of being clobbered back to clean.
+    global _notified_dirty
+    _notified_dirty = False
+    return {platform: sorted(uids) for platform, uids in _notified_users.items()}
+
+
+def _write_notified_users(payload: dict[str, list[str]]) -> bool:
+    global _notified_dirty
     try:
         with NOTIFIED_USERS_FILE.open("w", encoding="utf-8") as f:
-            json.dump(_notified_users, f, indent=2)
+            json.dump(payload, f, indent=2)
+        return True
     except Exception as exc:
+        _notified_dirty = True   # keep the shutdown flush armed
         logger.error(f"Could not save {NOTIFIED_USERS_FILE}: {exc}")
+        return False
+
+
+# Saves are debounced: a burst of first-time users triggers one coalesced
+# write instead of rewriting the JSON file per user, and the write itself
+# runs in a thread so the event loop never blocks on disk I/O.
+NOTIFIED_SAVE_DELAY = 2.0   # seconds
+
+_notified_save_task: asyncio.Task | None = None
+
+# True while marks exist that haven't hit disk yet. Checked at shutdown:
+# asyncio.run() cancels the pending save task during teardown, so the task
+# itself can't tell us whether its write ever ran.
+_notified_dirty = False
+
+
+async def _delayed_notified_save() -> None:
+    while True:
+        await asyncio.sleep(NOTIFIED_SAVE_DELAY)
+        ok = await asyncio.to_thread(_write_notified_users, _notified_snapshot())
+        # A mark that landed mid-write re-set the flag but couldn't schedule a
+        # new task (this one isn't done yet) – loop and save it now. Don't
+        # retry on write failure; the shutdown flush stays armed for those.
+        if not ok or not _notified_dirty:
+            return
+
+
+def _schedule_notified_save() -> None:
+    global _notified_save_task
+    if _notified_save_task is None or _notified_save_task.done():
+        _notified_save_task = asyncio.create_task(_delayed_notified_save())
 
 
 def _is_notified(platform: str, uid: str) -> bool:
@@ -367,9 +444,11 @@ def _is_notified(platform: str, uid: str) -> bool:
 
 
 def _mark_notified(platform: str, uid: str) -> None:
+    global _notified_dirty
     if uid not in _notified_users[platform]:
-        _notified_users[platform].append(uid)
-        _save_notified_users()
+        _notified_users[platform].add(uid)
+        _notified_dirty = True
+        _schedule_notified_save()
 
 
 # DM texts ─────────────────────────────────────────────────────────────────────
@@ -419,39 +498,92 @@ your messages will not be forwarded.
 discord_webhooks: dict[int, discord.Webhook] = {}
 stoat_channels:  dict[str, object]           = {}
 
-_d2s: OrderedDict[int, str] = OrderedDict()   # discord_msg_id → stoat_msg_id
-_s2d: OrderedDict[str, int] = OrderedDict()   # stoat_msg_id   → discord_msg_id
+# Plain dicts + a FIFO deque of insertion order – lookups never reorder, so
+# full LRU bookkeeping (move_to_end per insert) would be wasted work.
+_d2s: dict[int, str] = {}   # discord_msg_id → stoat_msg_id
+_s2d: dict[str, int] = {}   # stoat_msg_id   → discord_msg_id
+_pair_order: deque[tuple[int, str]] = deque()
 
 # Used in on_message_delete to choose the right deletion method.
 _webhook_discord_ids: set[int] = set()
 
-# used to break deletion loops.
-_discord_deleting: set[int] = set()   # discord msg IDs
-_stoat_deleting:   set[str] = set()   # stoat   msg IDs
+# Discord channel each webhook-sent message went to – known at send time, so
+# deletion never has to guess by trying every webhook.
+_webhook_msg_to_ch: dict[int, int] = {}
+
+# Fallback Stoat channel for delete events that arrive without a channel ID –
+# recomputed when the webhooks change instead of scanning per event.
+_stoat_fallback_ch: str | None = None
+
+# Used to break deletion loops.  id -> monotonic timestamp of the pending
+# delete, so the loop-break check is a single pop() and entries whose echo
+# event never arrives (lost gateway events) can be garbage-collected.
+_DELETING_TTL_S = 60
+
+_discord_deleting: dict[int, float] = {}   # discord msg IDs
+_stoat_deleting:   dict[str, float] = {}   # stoat   msg IDs
+
+
+async def _deleting_gc() -> None:
+    """Periodically drop loop-break entries whose delete echo never came back."""
+    while True:
+        await asyncio.sleep(_DELETING_TTL_S)
+        cutoff = _monotonic() - _DELETING_TTL_S
+        for pending in (_discord_deleting, _stoat_deleting):
+            stale = [mid for mid, ts in pending.items() if ts < cutoff]
+            for mid in stale:
+                del pending[mid]
 
 
 def _cache_pair(discord_id: int, stoat_id: str, *, from_webhook: bool = False) -> None:
-    for cache, key, val in ((_d2s, discord_id, stoat_id), (_s2d, stoat_id, discord_id)):
-        if key in cache:
-            cache.move_to_end(key)
-        cache[key] = val
-        if len(cache) > MSG_CACHE_SIZE:
-            cache.popitem(last=False)
+    prev_stoat_id = _d2s.get(discord_id)
+    if prev_stoat_id is None:
+        _pair_order.append((discord_id, stoat_id))
+        if len(_pair_order) > MSG_CACHE_SIZE:
+            old_d, old_s = _pair_order.popleft()
+            _d2s.pop(old_d, None)
+            _s2d.pop(old_s, None)
+            _webhook_discord_ids.discard(old_d)
+            _webhook_msg_to_ch.pop(old_d, None)
+    elif prev_stoat_id != stoat_id:
+        # Re-pairing an existing Discord ID: drop the stale reverse entry so
+        # _s2d stays bounded by the same cap as the deque.
+        _s2d.pop(prev_stoat_id, None)
+    _d2s[discord_id] = stoat_id
+    _s2d[stoat_id]   = discord_id
     if from_webhook:
         _webhook_discord_ids.add(discord_id)
 
 
+def _btrunc(s: str, n: int) -> str:
+    """Truncate to at most n UTF-8 bytes without splitting a character.
+
+    The platform limits are byte-oriented; a plain codepoint slice can
+    oversend emoji-heavy names and get the whole request rejected.
+    """
+    b = s.encode("utf-8")
+    if len(b) <= n:
+        return s
+    return b[:n].decode("utf-8", errors="ignore")
+
+
 def _extract_id(obj) -> str | None:
     """Pull an ID string from a raw dict, object, or plain string."""
     if obj is None:
         return None
-    if isinstance(obj, str):
+    # Branches ordered by expected frequency: reply targets usually arrive as
+    # bare strings; `type() is` skips the subclass walk isinstance would do.
+    if type(obj) is str:
         return obj or None
+    v = getattr(obj, "_id", None)
+    if v is None:
+        v = getattr(obj, "id", None)
+    if v:
+        return str(v)
     if isinstance(obj, dict):
         v = obj.get("_id") or obj.get("id")
         return str(v) if v else None
-    v = getattr(obj, "_id", None) or getattr(obj, "id", None)
-    return str(v) if v else None
+    return None
 
 
 def _stoat_asset_url(asset) -> str | None:
@@ -474,8 +606,8 @@ def _stoat_asset_url(asset) -> str | None:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-async def fetch_bytes(session: aiohttp.ClientSession, url: str) -> tuple[bytes, str] | None:
-    """Download url into RAM. Returns (data, filename) or None on any error."""
+async def fetch_bytes(session: aiohttp.ClientSession, url: str) -> tuple[io.BytesIO, str] | None:
+    """Download url into RAM. Returns (buffer, filename) or None on any error."""
     try:
         async with session.get(url) as resp:
             if resp.status != 200:
@@ -485,12 +617,19 @@ async def fetch_bytes(session: aiohttp.ClientSession, url: str) -> tuple[bytes,
             if cl and int(cl) > MAX_FILE_SIZE:
                 logger.warning(f"Skipping oversized file ({cl} B): {url}")
                 return None
-            data = await resp.read()
-            if len(data) > MAX_FILE_SIZE:
-                logger.warning(f"Skipping oversized file ({len(data)} B) after download")
-                return None
-            filename = url.split("?")[0].rstrip("/").rsplit("/", 1)[-1] or "file"
-            return data, filename
+            # Stream in chunks and abort as soon as the limit is exceeded, so
+            # a missing/lying Content-Length can't balloon memory. Writing
+            # straight into a BytesIO means the caller can hand it to
+            # discord.File without a second copy of the payload.
+            buf = io.BytesIO()
+            async for chunk in resp.content.iter_chunked(64 * 1024):
+                buf.write(chunk)
+                if buf.tell() > MAX_FILE_SIZE:
+                    logger.warning(f"Skipping oversized file (>{MAX_FILE_SIZE} B) during download: {url}")
+                    return None
+            buf.seek(0)
+            filename = os.path.basename(urlsplit(url).path) or "file"
+            return buf, filename
     except Exception as exc:
         logger.error(f"File fetch error for {url}: {exc}")
         return None
@@ -587,8 +726,7 @@ async def delete_stoat_message(channel_id: str, message_id: str, stoat_client: "
         return False
     try:
         async with session.delete(
-            f"{REVOLT_API_URL}/channels/{channel_id}/messages/{message_id}",
-            headers={"x-bot-token": STOAT_BOT_TOKEN},
+            f"{_REVOLT_CHANNELS_URL}/{channel_id}/messages/{message_id}",
         ) as resp:
             if resp.status in (200, 204):
                 return True
@@ -607,101 +745,203 @@ async def delete_stoat_message(channel_id: str, message_id: str, stoat_client: "
 #  MENTION / EMOJI HELPERS
 # ──────────────────────────────────────────────────────────────────────────────
 
-_RE_DISCORD_USER    = re.compile(r"<@!?(\d+)>")
-_RE_DISCORD_CHANNEL = re.compile(r"<#(\d+)>")
-_RE_DISCORD_ROLE    = re.compile(r"<@&(\d+)>")
-_RE_DISCORD_EMOJI   = re.compile(r"<a?:([A-Za-z0-9_]+):\d+>")
+# Combined alternation so all Discord markup is resolved in one left-to-right
+# pass. Compiled with re2 when available (see import block above).
+_RE_DISCORD_ALL = _regex.compile(
+    r"<(?:@!?(?P<u>\d+)|#(?P<c>\d+)|@&(?P<r>\d+)|a?:(?P<e>[A-Za-z0-9_]+):\d+)>"
+)
+
+# Combined alternation so user mentions and custom emojis are found in one scan.
+_RE_REVOLT_ANY = _regex.compile(r"<@([A-Z0-9]{26})>|:([A-Z0-9]{26}):")
+
+# Bounded LRU – without a cap every custom emoji the bot ever sees would
+# stay in memory for the lifetime of the process.
+EMOJI_CACHE_SIZE = 4096
+
+_emoji_name_cache: OrderedDict[str, str] = OrderedDict()
+
+# Resolved display names are stable for minutes – cache them so repeated
+# mentions of the same user don't re-hit the REST APIs.
+NAME_CACHE_TTL  = 600   # seconds
+NAME_CACHE_SIZE = 512
+
+_member_name_cache: OrderedDict[int, tuple[float, str]] = OrderedDict()
+_revolt_user_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+_avatar_url_cache:  OrderedDict[int, tuple[float, str]] = OrderedDict()
+
+# Bound reference – skips the module attribute lookup per call on hot paths.
+_monotonic = time.monotonic
+
+
+def _name_cache_get(cache: OrderedDict, key) -> str | None:
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    ts, name = entry
+    if _monotonic() - ts > NAME_CACHE_TTL:
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return name
+
 
-_RE_REVOLT_USER       = re.compile(r"<@([A-Z0-9]{26})>")
-_RE_REVOLT_CUSTOM_EMO = re.compile(r":([A-Z0-9]{26}):")
+def _name_cache_put(cache: OrderedDict, key, name: str) -> None:
+    cache[key] = (_monotonic(), name)
+    cache.move_to_end(key)
+    if len(cache) > NAME_CACHE_SIZE:
+        cache.popitem(last=False)
 
-_emoji_name_cache: dict[str, str] = {}
 
+def _discord_avatar_url(author: discord.User | discord.Member) -> str:
+    """Avatar URL for a Discord user, cached – it is stable for minutes."""
+    cached = _name_cache_get(_avatar_url_cache, author.id)
+    if cached is not None:
+        return cached
+    url = str(author.avatar.url) if author.avatar else str(author.default_avatar.url)
+    _name_cache_put(_avatar_url_cache, author.id, url)
+    return url
 
-async def resolve_revolt_emoji(emoji_id: str, session: aiohttp.ClientSession, token: str) -> str:
-    if emoji_id in _emoji_name_cache:
-        return _emoji_name_cache[emoji_id]
+
+async def resolve_revolt_emoji(emoji_id: str, session: aiohttp.ClientSession) -> str:
+    cached = _emoji_name_cache.get(emoji_id)
+    if cached is not None:
+        _emoji_name_cache.move_to_end(emoji_id)
+        return cached
     try:
         async with session.get(
-            f"{REVOLT_API_URL}/custom/emoji/{emoji_id}",
-            headers={"x-bot-token": token},
+            f"{_REVOLT_EMOJI_URL}/{emoji_id}",
         ) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await resp.json(loads=_json_loads)
                 name = data.get("name") or emoji_id
                 _emoji_name_cache[emoji_id] = name
+                if len(_emoji_name_cache) > EMOJI_CACHE_SIZE:
+                    _emoji_name_cache.popitem(last=False)
                 return name
     except Exception as exc:
         logger.debug(f"Could not resolve Stoat emoji {emoji_id}: {exc}")
     return emoji_id
 
 
+# Regex passes for messages at least this long run via asyncio.to_thread so
+# they can't stall the event loop; below it the thread hand-off costs more
+# than the scan itself.
+_CLEAN_OFFLOAD_MIN_LEN = 1024
+
+
+def _scan_discord_uids(content: str) -> set[int]:
+    """CPU-only phase 1: collect the mentioned user IDs."""
+    return {int(m.group("u")) for m in _RE_DISCORD_ALL.finditer(content) if m.group("u")}
+
+
+def _sub_discord_markup(content: str, guild, resolved: dict[int, str]) -> str:
+    """CPU-only phase 2: one re.sub pass with all lookups pre-resolved."""
+
+    def _repl(m: re.Match) -> str:
+        if m.group("u") is not None:
+            uid  = int(m.group("u"))
+            name = resolved.get(uid)
+            return f"@{name}" if name else f"@user{uid}"
+        if m.group("c") is not None:
+            ch = guild.get_channel(int(m.group("c"))) if guild else None
+            return f"#{ch.name}" if ch else "#channel"
+        if m.group("r") is not None:
+            role = guild.get_role(int(m.group("r"))) if guild else None
+            return f"@{role.name}" if role else "@role"
+        return f":{m.group('e')}:"  # custom emoji
+
+    return _RE_DISCORD_ALL.sub(_repl, content)
+
+
 async def clean_discord_content(content: str, message: discord.Message) -> str:
     """Resolve Discord markup to plain text before forwarding to Stoat."""
-    guild  = message.guild
-    result = content
-
-    for m in reversed(list(_RE_DISCORD_USER.finditer(result))):
-        uid  = int(m.group(1))
-        name = f"@user{uid}"
-        if guild:
+    guild   = message.guild
+    offload = len(content) >= _CLEAN_OFFLOAD_MIN_LEN
+
+    # Resolve mentioned members up-front: cached ones via get_member, the rest
+    # fetched concurrently so N misses cost one round-trip of wall time.
+    resolved: dict[int, str] = {}
+    if offload:
+        uids = await asyncio.to_thread(_scan_discord_uids, content)
+    else:
+        uids = _scan_discord_uids(content)
+    if uids and guild:
+        missing: list[int] = []
+        for uid in uids:
             member = guild.get_member(uid)
-            if member is None:
-                try:
-                    member = await guild.fetch_member(uid)
-                except Exception:
-                    member = None
-            if member:
-                name = f"@{member.display_name}"
-        result = result[: m.start()] + name + result[m.end() :]
-
-    def _channel(m: re.Match) -> str:
-        ch = guild.get_channel(int(m.group(1))) if guild else None
-        return f"#{ch.name}" if ch else "#channel"
+            if member is not None:
+                resolved[uid] = member.display_name
+                continue
+            cached = _name_cache_get(_member_name_cache, uid)
+            if cached is not None:
+                resolved[uid] = cached
+            else:
+                missing.append(uid)
+        if missing:
+            fetched = await asyncio.gather(
+                *(guild.fetch_member(uid) for uid in missing),
+                return_exceptions=True,
+            )
+            for uid, member in zip(missing, fetched):
+                if not isinstance(member, BaseException):
+                    resolved[uid] = member.display_name
+                    _name_cache_put(_member_name_cache, uid, member.display_name)
 
-    result = _RE_DISCORD_CHANNEL.sub(_channel, result)
+    if offload:
+        return await asyncio.to_thread(_sub_discord_markup, content, guild, resolved)
+    return _sub_discord_markup(content, guild, resolved)
 
-    def _role(m: re.Match) -> str:
-        role = guild.get_role(int(m.group(1))) if guild else None
-        return f"@{role.name}" if role else "@role"
 
-    result = _RE_DISCORD_ROLE.sub(_role, result)
-    result = _RE_DISCORD_EMOJI.sub(lambda m: f":{m.group(1)}:", result)
-    return result
+async def _resolve_revolt_user(uid: str, session: aiohttp.ClientSession) -> str:
+    cached = _name_cache_get(_revolt_user_cache, uid)
+    if cached is not None:
+        return cached
+    try:
+        async with session.get(
+            f"{_REVOLT_USERS_URL}/{uid}",
+        ) as resp:
+            if resp.status == 200:
+                data = await resp.json(loads=_json_loads)
+                name = data.get("display_name") or data.get("username") or uid
+                _name_cache_put(_revolt_user_cache, uid, name)
+                return name
+    except Exception as exc:
+        logger.debug(f"Could not resolve Revolt user {uid}: {exc}")
+    return "user"
 
 
-async def clean_stoat_content(
-    content: str,
-    session: aiohttp.ClientSession,
-    token: str,
-) -> str:
+async def clean_stoat_content(content: str, session: aiohttp.ClientSession) -> str:
     """Resolve Stoat markup to plain text before forwarding to Discord."""
-    result = content
+    # Fast path: most messages contain neither markup literal – skip all
+    # regex work with two C-level substring checks.
+    if "<@" not in content and ":" not in content:
+        return content
+
+    # One scan collects both kinds of IDs; resolve them concurrently up-front,
+    # then substitute in a single pass – no per-match string splicing.
+    uids:      set[str] = set()
+    emoji_ids: set[str] = set()
+    for m in _RE_REVOLT_ANY.finditer(content):
+        if m.group(1):
+            uids.add(m.group(1))
+        else:
+            emoji_ids.add(m.group(2))
+    if not uids and not emoji_ids:
+        return content
 
-    for m in reversed(list(_RE_REVOLT_USER.finditer(result))):
-        uid  = m.group(1)
-        name = "@user"
-        try:
-            async with session.get(
-                f"{REVOLT_API_URL}/users/{uid}",
-                headers={"x-bot-token": token},
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    name = "@" + (data.get("display_name") or data.get("username") or uid)
-        except Exception as exc:
-            logger.debug(f"Could not resolve Revolt user {uid}: {exc}")
-        result = result[: m.start()] + name + result[m.end() :]
+    resolved = await asyncio.gather(
+        *(_resolve_revolt_user(uid, session) for uid in uids),
+        *(resolve_revolt_emoji(eid, session) for eid in emoji_ids),
+    )
+    names       = dict(zip(uids, resolved))
+    emoji_names = dict(zip(emoji_ids, resolved[len(uids):]))
 
-    matches = list(_RE_REVOLT_CUSTOM_EMO.finditer(result))
-    if matches:
-        names = await asyncio.gather(
-            *[resolve_revolt_emoji(m.group(1), session, token) for m in matches]
-        )
-        for m, name in zip(reversed(matches), reversed(names)):
-            result = result[: m.start()] + f":{name}:" + result[m.end() :]
+    def _repl(m: re.Match) -> str:
+        if m.group(1):
+            return "@" + names[m.group(1)]
+        return f":{emoji_names[m.group(2)]}:"
 
-    return result
+    return _RE_REVOLT_ANY.sub(_repl, content)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -717,21 +957,53 @@ class StoatBot(stoat.Client):
         self._discord_bot: "DiscordBot | None" = None  # set in main()
         self._healthpulse: bool = False
         self._health_msg_id: str | None = None
+        # Watchdog state – event-driven: handlers pulse these and the watchdog
+        # blocks on them instead of polling timestamps.
+        self._ready_event: asyncio.Event = asyncio.Event()
+        self._event_pulse: asyncio.Event = asyncio.Event()
+        self._start_task: asyncio.Task | None = None  # set by _run_stoat_with_restart
+
+    def dispatch(self, *args, **kwargs):
+        # Any gateway traffic at all proves the connection is alive – pulse at
+        # the dispatch layer so a quiet evening in the bridged channels doesn't
+        # read as a dead socket. (Pass-through: works whether the library's
+        # dispatch is sync or async, since a returned coroutine is awaited by
+        # the caller as usual.)
+        self._event_pulse.set()
+        return super().dispatch(*args, **kwargs)
 
     async def on_ready(self, event, /):
+        self._ready_event.set()
+        self._event_pulse.set()
+
         if self._http_session and not self._http_session.closed:
             await self._http_session.close()
-        self._http_session = aiohttp.ClientSession()
+        # Nearly every outbound call hits the one Revolt API host – keep
+        # connections warm and cache DNS so we don't pay a TLS handshake and
+        # lookup per request. The bot token rides along as a default header.
+        self._http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+            ),
+            headers={"x-bot-token": STOAT_BOT_TOKEN},
+        )
 
         logger.info(f"Stoat: on_ready fired as {self.me} – running health check…")
 
-        stoat_channels.clear()
-        for stoat_id in STOAT_CHANNEL_IDS:
-            try:
-                ch = await self.fetch_channel(stoat_id)
-                stoat_channels[stoat_id] = ch
-            except Exception as exc:
-                logger.error(f"Stoat: could not fetch channel {stoat_id} - {exc}")
+        # Fetch all channels concurrently; keep any previously working channel
+        # object when a reconnect-time fetch fails transiently.
+        results = await asyncio.gather(
+            *(self.fetch_channel(stoat_id) for stoat_id in STOAT_CHANNEL_IDS),
+            return_exceptions=True,
+        )
+        for stoat_id, result in zip(STOAT_CHANNEL_IDS, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Stoat: could not fetch channel {stoat_id} - {result}")
+            else:
+                stoat_channels[stoat_id] = result
 
         await self._run_health_check()
 
@@ -787,8 +1059,7 @@ class StoatBot(stoat.Client):
             return
         try:
             async with self._http_session.delete(
-                f"{REVOLT_API_URL}/channels/{channel_id}/messages/{message_id}",
-                headers={"x-bot-token": STOAT_BOT_TOKEN},
+                f"{_REVOLT_CHANNELS_URL}/{channel_id}/messages/{message_id}",
             ) as resp:
                 if resp.status in (200, 204):
                     logger.debug("Stoat: health check message deleted")
@@ -806,6 +1077,7 @@ class StoatBot(stoat.Client):
         os.execv(sys.executable, [sys.executable] + sys.argv)
 
     async def on_error(self, event, /):
+        self._event_pulse.set()
         logger.error(f"Stoat: ⚠ Error event from gateway: {event!r}")
 
     # ── Send a DM on Stoat ────────────────────────────────────────────────────
@@ -818,13 +1090,12 @@ class StoatBot(stoat.Client):
         try:
             # Open (or fetch existing) DM channel with the user
             async with session.get(
-                f"{REVOLT_API_URL}/users/{user_id}/dm",
-                headers={"x-bot-token": STOAT_BOT_TOKEN},
+                f"{_REVOLT_USERS_URL}/{user_id}/dm",
             ) as resp:
                 if resp.status != 200:
                     logger.debug(f"Stoat: open DM channel failed for {user_id}: HTTP {resp.status}")
                     return
-                dm_data = await resp.json()
+                dm_data = await resp.json(loads=_json_loads)
 
             dm_channel_id = dm_data.get("_id") or dm_data.get("id")
             if not dm_channel_id:
@@ -833,8 +1104,7 @@ class StoatBot(stoat.Client):
 
             # Send the welcome message into the DM channel
             async with session.post(
-                f"{REVOLT_API_URL}/channels/{dm_channel_id}/messages",
-                headers={"x-bot-token": STOAT_BOT_TOKEN},
+                f"{_REVOLT_CHANNELS_URL}/{dm_channel_id}/messages",
                 json={"content": STOAT_WELCOME_DM[:2000]},
             ) as resp:
                 if resp.status in (200, 201):
@@ -847,6 +1117,11 @@ class StoatBot(stoat.Client):
             logger.debug(f"Stoat: could not DM user {user_id}: {exc}")
 
     async def on_message_create(self, event: stoat.MessageCreateEvent, /):
+        # Liveness first – any event counts, bridged channel or not – then the
+        # cheapest gates: on a big server most events are from channels we
+        # don't bridge.
+        self._event_pulse.set()
+
         msg = event.message
 
         if msg.author_id == self.me.id:
@@ -854,7 +1129,7 @@ class StoatBot(stoat.Client):
             return
 
         stoat_id = msg.channel.id
-        if stoat_id not in STOAT_TO_DISCORD:
+        if stoat_id not in _BRIDGED_STOAT_IDS:
             return
 
         # ── First-time DM ─────────────────────────────────────────────────────
@@ -870,9 +1145,7 @@ class StoatBot(stoat.Client):
             return
 
         # ── Clean content ─────────────────────────────────────────────────────
-        content = await clean_stoat_content(
-            msg.content or "", self._http_session, STOAT_BOT_TOKEN
-        )
+        content = await clean_stoat_content(msg.content or "", self._http_session)
 
         # ── Reply → quote fallback ────────────────────────────────────────────
         replies_raw = getattr(msg, "replies", None) or []
@@ -884,8 +1157,8 @@ class StoatBot(stoat.Client):
         if reply_id:
             orig = await fetch_stoat_message(stoat_id, reply_id, self)
             if orig is not None:
-                orig_author  = orig.author.display_name[:50]
-                orig_snippet = (orig.content or "")[:80].replace("\n", " ")
+                orig_author  = _btrunc(orig.author.display_name, 50)
+                orig_snippet = _btrunc(orig.content or "", 80).replace("\n", " ")
                 content = f"-# ↩ **{orig_author}**: *{orig_snippet}*\n{content}"
             else:
                 logger.warning(f"Stoat -> Discord: could not fetch reply target '{reply_id}'")
@@ -901,18 +1174,18 @@ class StoatBot(stoat.Client):
             if result is None:
                 content += f"\n{url}"
                 continue
-            data, fname = result
-            discord_files.append(discord.File(io.BytesIO(data), filename=filename or fname))
-            del data
+            buf, fname = result
+            discord_files.append(discord.File(buf, filename=filename or fname))
 
         if not content.strip() and not discord_files:
             return
 
-        author_name = (
+        author_name = _btrunc(
             getattr(msg.author, "display_name", None)
             or getattr(msg.author, "name", None)
-            or "unknown"
-        )[:80]
+            or "unknown",
+            80,
+        )
         avatar_url = _stoat_asset_url(getattr(msg.author, "avatar", None))
 
         try:
@@ -924,6 +1197,7 @@ class StoatBot(stoat.Client):
                 wait       = True,
             )
             _cache_pair(sent.id, str(msg.id), from_webhook=True)
+            _webhook_msg_to_ch[sent.id] = discord_id
             logger.debug(f"Stoat -> Discord: ✓ forwarded message from {author_name}")
         except Exception as exc:
             logger.error(f"Stoat -> Discord (channel {discord_id}): {exc}")
@@ -935,6 +1209,7 @@ class StoatBot(stoat.Client):
 
     async def on_message_delete(self, event, /):
         """When a Stoat message is deleted, remove the mirrored Discord message."""
+        self._event_pulse.set()
         try:
             msg_id     = _extract_id(getattr(event, "message_id", None) or getattr(event, "id", None))
             channel_id = _extract_id(getattr(event, "channel_id", None))
@@ -949,8 +1224,7 @@ class StoatBot(stoat.Client):
                 return
 
             # Loop-break: if we triggered this deletion ourselves, ignore it.
-            if msg_id in _stoat_deleting:
-                _stoat_deleting.discard(msg_id)
+            if _stoat_deleting.pop(msg_id, None) is not None:
                 return
 
             discord_msg_id = _s2d.get(str(msg_id))
@@ -958,38 +1232,28 @@ class StoatBot(stoat.Client):
                 return  # Not a bridged message
 
             # Resolve the Discord channel ID
-            stoat_ch_id   = channel_id or next(
-                (s for s, d in STOAT_TO_DISCORD.items() if d in discord_webhooks), None
-            )
+            stoat_ch_id   = channel_id or _stoat_fallback_ch
             discord_ch_id = STOAT_TO_DISCORD.get(stoat_ch_id) if stoat_ch_id else None
 
-            _discord_deleting.add(discord_msg_id)
+            _discord_deleting[discord_msg_id] = _monotonic()
 
             # ── Case 1: message was originally sent via webhook (Stoat→Discord) ──
             if discord_msg_id in _webhook_discord_ids:
                 webhook = discord_webhooks.get(discord_ch_id) if discord_ch_id else None
                 if webhook is None:
-                    # Fall back: try every webhook
-                    for _, wh in discord_webhooks.items():
-                        try:
-                            await wh.delete_message(discord_msg_id)
-                            _webhook_discord_ids.discard(discord_msg_id)
-                            return
-                        except discord.NotFound:
-                            _discord_deleting.discard(discord_msg_id)
-                            return
-                        except Exception:
-                            pass
-                    _discord_deleting.discard(discord_msg_id)
+                    # The sending channel was recorded at forward time.
+                    webhook = discord_webhooks.get(_webhook_msg_to_ch.get(discord_msg_id))
+                if webhook is None:
+                    _discord_deleting.pop(discord_msg_id, None)
                     return
                 try:
                     await webhook.delete_message(discord_msg_id)
                     _webhook_discord_ids.discard(discord_msg_id)
                 except discord.NotFound:
-                    _discord_deleting.discard(discord_msg_id)
+                    _discord_deleting.pop(discord_msg_id, None)
                     logger.debug(f"Discord webhook message {discord_msg_id} already gone")
                 except Exception as exc:
-                    _discord_deleting.discard(discord_msg_id)
+                    _discord_deleting.pop(discord_msg_id, None)
                     logger.error(f"Stoat -> Discord: could not delete webhook msg {discord_msg_id}: {exc}")
 
             # ── Case 2: message was originally sent by a Discord user (Discord→Stoat) ──
@@ -999,20 +1263,18 @@ class StoatBot(stoat.Client):
                         "Stoat -> Discord: cannot delete user message – "
                         "discord_bot reference or channel ID missing"
                     )
-                    _discord_deleting.discard(discord_msg_id)
+                    _discord_deleting.pop(discord_msg_id, None)
                     return
                 try:
-                    ch = (
-                        self._discord_bot.get_channel(discord_ch_id)
-                        or await self._discord_bot.fetch_channel(discord_ch_id)
-                    )
-                    msg = ch.get_partial_message(discord_msg_id)
-                    await msg.delete()
+                    # A partial messageable deletes by ID directly – no need
+                    # to round-trip for the channel object first.
+                    ch = self._discord_bot.get_partial_messageable(discord_ch_id)
+                    await ch.get_partial_message(discord_msg_id).delete()
                 except discord.NotFound:
-                    _discord_deleting.discard(discord_msg_id)
+                    _discord_deleting.pop(discord_msg_id, None)
                     logger.debug(f"Discord user message {discord_msg_id} already gone")
                 except Exception as exc:
-                    _discord_deleting.discard(discord_msg_id)
+                    _discord_deleting.pop(discord_msg_id, None)
                     logger.error(f"Stoat -> Discord: could not delete user msg {discord_msg_id}: {exc}")
 
         except Exception as exc:
@@ -1037,30 +1299,61 @@ class DiscordBot(commands.Bot):
         # Keep a reference to the StoatBot so we can call delete on it
         self._stoat_bot: StoatBot | None = None
 
+        # IDs of our own bridge webhooks – maintained in _setup_webhooks so
+        # on_message doesn't rebuild a set per incoming message.
+        self._self_webhook_ids: set[int] = set()
+
+        # One shared session for all webhook posts – keepalive connections to
+        # discord.com instead of a handshake per delivery.
+        self._webhook_session: aiohttp.ClientSession | None = None
+
     async def setup_hook(self):
         self.loop.create_task(self._setup_webhooks())
 
+    async def _setup_one_webhook(self, discord_id: int) -> None:
+        try:
+            channel = self.get_channel(discord_id) or await self.fetch_channel(discord_id)
+            for wh in await channel.webhooks():
+                if wh.user == self.user:
+                    logger.info(f"Discord: reusing webhook '{wh.name}' for channel {discord_id}")
+                    break
+            else:
+                wh = await channel.create_webhook(name="Stoat Bridge")
+                logger.info(f"Discord: created webhook for channel {discord_id}")
+            # Rebind onto the shared session so every send/delete reuses its
+            # keepalive connections.
+            discord_webhooks[discord_id] = discord.Webhook.from_url(
+                wh.url, session=self._webhook_session
+            )
+            self._self_webhook_ids.add(wh.id)
+        except Exception as exc:
+            logger.error(f"Discord: could not set up webhook for channel {discord_id} - {exc}")
+
     async def _setup_webhooks(self):
+        global _stoat_fallback_ch
         await self.wait_until_ready()
-        for discord_id in DISCORD_CHANNEL_IDS:
-            try:
-                channel = self.get_channel(discord_id) or await self.fetch_channel(discord_id)
-                for wh in await channel.webhooks():
-                    if wh.user == self.user:
-                        discord_webhooks[discord_id] = wh
-                        logger.info(f"Discord: reusing webhook '{wh.name}' for channel {discord_id}")
-                        break
-                else:
-                    wh = await channel.create_webhook(name="Stoat Bridge")
-                    discord_webhooks[discord_id] = wh
-                    logger.info(f"Discord: created webhook for channel {discord_id}")
-            except Exception as exc:
-                logger.error(f"Discord: could not set up webhook for channel {discord_id} - {exc}")
+        if self._webhook_session is None or self._webhook_session.closed:
+            self._webhook_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=75)
+            )
+        # All channels in parallel: startup costs ~1 round-trip instead of N.
+        await asyncio.gather(
+            *(self._setup_one_webhook(discord_id) for discord_id in DISCORD_CHANNEL_IDS)
+        )
+
+        _stoat_fallback_ch = next(
+            (s for s, d in STOAT_TO_DISCORD.items() if d in discord_webhooks), None
+        )
 
     async def on_ready(self):
         logger.info(f"Discord: connected as {self.user}")
         logger.info(f"Discord: bridging {PAIR_COUNT} channel pair(s)")
 
+    async def close(self):
+        if self._webhook_session is not None and not self._webhook_session.closed:
+            await self._webhook_session.close()
+        await super().close()
+
     # ── Send a DM on Discord ──────────────────────────────────────────────────
 
     async def _try_send_discord_dm(self, user: discord.User | discord.Member) -> None:
@@ -1080,15 +1373,13 @@ class DiscordBot(commands.Bot):
             logger.debug(f"Discord: could not DM {user}: {exc}")
 
     async def on_message(self, message: discord.Message):
-        if message.author == self.user:
-            return
-
-        if message.webhook_id is not None:
-            if message.webhook_id in {wh.id for wh in discord_webhooks.values()}:
-                return
-
+        # One combined gate, dominant "not my channel" check first.
         discord_id = message.channel.id
-        if discord_id not in DISCORD_TO_STOAT:
+        if (
+            discord_id not in _BRIDGED_DISCORD_IDS
+            or message.author == self.user
+            or message.webhook_id in self._self_webhook_ids
+        ):
             return
 
         # ── First-time DM ─────────────────────────────────────────────────────
@@ -1123,33 +1414,42 @@ class DiscordBot(commands.Bot):
                     f"Discord -> Stoat: reply ref={ref_discord_id} not in cache, using quote"
                 )
                 try:
-                    ref_msg = (
-                        message.reference.resolved
-                        if isinstance(message.reference.resolved, discord.Message)
-                        else await message.channel.fetch_message(ref_discord_id)
-                    )
-                    ref_author  = ref_msg.author.display_name[:50]
-                    ref_snippet = (ref_msg.content or "")[:80].replace("\n", " ")
+                    ref_msg = message.reference.resolved
+                    if not isinstance(ref_msg, discord.Message):
+                        # Check the client's message cache before paying an
+                        # HTTP round-trip for the reply target.
+                        ref_msg = (
+                            discord.utils.get(self.cached_messages, id=ref_discord_id)
+                            or await message.channel.fetch_message(ref_discord_id)
+                        )
+                    ref_author  = _btrunc(ref_msg.author.display_name, 50)
+                    ref_snippet = _btrunc(ref_msg.content or "", 80).replace("\n", " ")
                     content = f"-# ↩ **{ref_author}**: *{ref_snippet}*\n{content}"
                 except Exception as exc:
                     logger.debug(f"Could not fetch Discord reply target {ref_discord_id}: {exc}")
 
         # ── Attachments ───────────────────────────────────────────────────────
-        for att in message.attachments:
-            content += f" {att.url}"
+        # Join once instead of concatenating per URL, and stop appending what
+        # the 2000-char limit would truncate anyway.
+        if message.attachments:
+            parts     = [content]
+            remaining = 2000 - len(content)
+            for att in message.attachments:
+                if remaining <= 0:
+                    break
+                piece = f" {att.url}"
+                parts.append(piece)
+                remaining -= len(piece)
+            content = "".join(parts)[:2000]
 
         if not content.strip():
             return
 
-        avatar_url = (
-            str(message.author.avatar.url)
-            if message.author.avatar
-            else str(message.author.default_avatar.url)
-        )
+        avatar_url = _discord_avatar_url(message.author)
 
         send_kwargs: dict = {
             "masquerade": stoat.Masquerade(
-                name=message.author.display_name[:32],
+                name=_btrunc(message.author.display_name, 32),
                 avatar=avatar_url,
             ),
             "content": content[:2000],
@@ -1179,12 +1479,11 @@ class DiscordBot(commands.Bot):
         discord_msg_id = payload.message_id
 
         # Loop-break: if triggered on ourselves, ignore it.
-        if discord_msg_id in _discord_deleting:
-            _discord_deleting.discard(discord_msg_id)
+        if _discord_deleting.pop(discord_msg_id, None) is not None:
             return
 
         discord_ch_id = payload.channel_id
-        if discord_ch_id not in DISCORD_TO_STOAT:
+        if discord_ch_id not in _BRIDGED_DISCORD_IDS:
             return
 
         stoat_msg_id = _d2s.get(discord_msg_id)
@@ -1197,10 +1496,191 @@ class DiscordBot(commands.Bot):
             logger.warning("Discord -> Stoat: _stoat_bot reference not set, cannot delete")
             return
 
-        _stoat_deleting.add(stoat_msg_id)
+        _stoat_deleting[stoat_msg_id] = _monotonic()
         success = await delete_stoat_message(stoat_ch_id, stoat_msg_id, self._stoat_bot)
         if not success:
-            _stoat_deleting.discard(stoat_msg_id)
+            _stoat_deleting.pop(stoat_msg_id, None)
+
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """Mirror Discord bulk deletions (purges) on Stoat concurrently."""
+        stoat_ch_id = DISCORD_TO_STOAT.get(payload.channel_id)
+        if stoat_ch_id is None:
+            return
+
+        if self._stoat_bot is None:
+            logger.warning("Discord -> Stoat: _stoat_bot reference not set, cannot bulk delete")
+            return
+
+        stoat_msg_ids: list[str] = []
+        for discord_msg_id in payload.message_ids:
+            # Loop-break: skip deletions we triggered ourselves.
+            if _discord_deleting.pop(discord_msg_id, None) is not None:
+                continue
+            stoat_msg_id = _d2s.get(discord_msg_id)
+            if stoat_msg_id is not None:
+                stoat_msg_ids.append(stoat_msg_id)
+
+        if not stoat_msg_ids:
+            return
+
+        now = _monotonic()
+        _stoat_deleting.update((mid, now) for mid in stoat_msg_ids)
+        results = await asyncio.gather(
+            *(delete_stoat_message(stoat_ch_id, mid, self._stoat_bot) for mid in stoat_msg_ids),
+            return_exceptions=True,
+        )
+        for stoat_msg_id, success in zip(stoat_msg_ids, results):
+            if success is not True:
+                _stoat_deleting.pop(stoat_msg_id, None)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+#  STOAT CONNECTION WATCHDOG
+# ──────────────────────────────────────────────────────────────────────────────
+#
+#  Like the health check, this exists due to problems in stoat's API: the
+#  gateway can silently wedge without the library ever raising. The watchdog
+#  closes the connection when on_ready never arrives or the gateway goes
+#  quiet, and the runner loop reconnects.
+
+_WATCHDOG_INTERVAL = 20     # grace period after a forced close before re-checking
+_READY_TIMEOUT_S   = 120    # no on_ready this long after connecting → restart
+_SILENCE_TIMEOUT_S = 900    # no gateway event this long → restart
+
+
+def _new_stoat_bot(discord_bot: DiscordBot, previous: StoatBot | None = None) -> StoatBot:
+    """Build and wire up a Stoat client.
+
+    stoat.py cannot revive a closed client: close() leaves the shard socket
+    bound and the adapter sessions closed, so start() on the same instance
+    raises "connection is already open". Reconnecting therefore means a fresh
+    instance. The watchdog events are carried over from the previous client so
+    the watchdog keeps observing the replacement, and discord_bot._stoat_bot
+    always points at the live instance.
+    """
+    bot = StoatBot(
+        token=STOAT_BOT_TOKEN,
+        http_base=REVOLT_API_URL,       # This is only needed if you run an self-hosted instance
+        websocket_base=REVOLT_WS_URL,
+    )
+    bot._discord_bot = discord_bot       # cross-reference for user-message deletion
+    discord_bot._stoat_bot = bot         # cross-reference for deletion
+    if previous is not None:
+        bot._ready_event = previous._ready_event
+        bot._event_pulse = previous._event_pulse
+    return bot
+
+
+async def _run_stoat_with_restart(stoat_bot: StoatBot, discord_bot: DiscordBot) -> None:
+    """Run the Stoat bot, rebuilding a fresh client whenever the connection ends."""
+    while True:
+        stoat_bot._ready_event.clear()
+        stoat_bot._event_pulse.clear()
+        task = asyncio.create_task(stoat_bot.start())
+        stoat_bot._start_task = task
+        try:
+            await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise   # the bridge itself is shutting down
+            logger.warning("Stoat: connection task cancelled by watchdog")
+        except Exception as exc:
+            logger.error(f"Stoat: connection ended: {exc}")
+        logger.warning("Stoat: connection closed – reconnecting with a fresh client in 5s…")
+        await asyncio.sleep(5)
+        stoat_bot = _new_stoat_bot(discord_bot, previous=stoat_bot)
+
+
+_WATCHDOG_CLOSE_TIMEOUT_S = 5
+
+
+async def _watchdog_close(stoat_bot: StoatBot) -> None:
+    """Close the Stoat connection, bounded so a hung close() can't wedge the watchdog."""
+    task = stoat_bot._start_task
+    try:
+        async with asyncio.timeout(_WATCHDOG_CLOSE_TIMEOUT_S):
+            await stoat_bot.close()
+            if task is not None:
+                # close() returning doesn't guarantee start() has unwound, and
+                # the runner only swaps in a fresh client once its task ends –
+                # wait for it within the same bound.
+                await asyncio.wait([task])
+        return
+    except asyncio.CancelledError:
+        raise   # shutdown – never swallow cancellation
+    except TimeoutError:
+        logger.warning(
+            f"Stoat: watchdog – close() hung for {_WATCHDOG_CLOSE_TIMEOUT_S}s, "
+            "cancelling the connection task"
+        )
+    except (ConnectionError, OSError, aiohttp.ClientError) as exc:
+        logger.debug(f"Stoat: watchdog close failed: {exc}")
+    except Exception:
+        logger.exception("Stoat: watchdog – unexpected error while closing")
+
+    # close() didn't finish cleanly – cancel the connection task so the runner
+    # loop can move on and build a fresh client instead of waiting on a
+    # half-closed bot (this instance is unusable either way).
+    if task is not None and not task.done():
+        task.cancel()
+
+
+async def _stoat_watchdog(discord_bot: DiscordBot) -> None:
+    """Close the Stoat connection when it looks dead so the runner reconnects.
+
+    Event-driven: blocks on the ready/pulse events with a timeout instead of
+    polling timestamps, so an idle bot causes zero wake-ups and a stall is
+    detected as soon as its timeout elapses. The current client is read via
+    discord_bot._stoat_bot each time – the runner swaps in a fresh instance
+    after every forced close. The events survive the swap (carried over by
+    _new_stoat_bot), so they can be snapshotted once.
+    """
+    # Snapshot the configuration constants and helpers – they never change at
+    # runtime, and locals are cheaper than module-global lookups per iteration.
+    ready_timeout   = _READY_TIMEOUT_S
+    silence_timeout = _SILENCE_TIMEOUT_S
+    reconnect_grace = _WATCHDOG_INTERVAL
+    _sleep    = asyncio.sleep
+    _wait_for = asyncio.wait_for
+    ready_event = discord_bot._stoat_bot._ready_event
+    event_pulse = discord_bot._stoat_bot._event_pulse
+    last_pong = None   # shard heartbeat marker as of the previous silence check
+
+    while True:
+        if not ready_event.is_set():
+            try:
+                await _wait_for(ready_event.wait(), timeout=ready_timeout)
+            except TimeoutError:
+                logger.error(
+                    f"Stoat: watchdog – no on_ready within {ready_timeout}s, "
+                    "closing connection…"
+                )
+                await _watchdog_close(discord_bot._stoat_bot)
+                await _sleep(reconnect_grace)   # let the runner reconnect
+            continue
+
+        event_pulse.clear()
+        try:
+            await _wait_for(event_pulse.wait(), timeout=silence_timeout)
+        except TimeoutError:
+            if not ready_event.is_set():
+                continue
+            stoat_bot = discord_bot._stoat_bot
+            # Heartbeat pongs never go through dispatch, so a fully idle
+            # server produces zero pulses even on a healthy connection.
+            # Before declaring the gateway dead, check whether the shard's
+            # pong marker moved during the window – comparing for change
+            # avoids depending on the marker's clock/type.
+            pong = getattr(getattr(stoat_bot, "shard", None), "last_pong_at", None)
+            if pong is not None and pong != last_pong:
+                last_pong = pong
+                continue
+            logger.error(
+                f"Stoat: watchdog – gateway silent for {silence_timeout}s, "
+                "closing connection…"
+            )
+            await _watchdog_close(stoat_bot)
+            await _sleep(reconnect_grace)   # let the runner reconnect
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -1219,23 +1699,35 @@ async def main():
     for i, (d, s, dir_) in enumerate(zip(DISCORD_CHANNEL_IDS, STOAT_CHANNEL_IDS, CHANNEL_DIRECTIONS), 1):
         logger.info(f"  Pair {i}: Discord {d} {_dir_arrow.get(dir_, '<->')} Stoat {s}  [{dir_}]")
 
-    stoat_bot   = StoatBot(
-        token=STOAT_BOT_TOKEN,
-        http_base=REVOLT_API_URL,       # This is only needed if you run an self-hosted instance
-        websocket_base=REVOLT_WS_URL,
-    )
     discord_bot = DiscordBot()
-    discord_bot._stoat_bot = stoat_bot   # cross-reference for deletion
-    stoat_bot._discord_bot = discord_bot  # cross-reference for user-message deletion
+    stoat_bot   = _new_stoat_bot(discord_bot)
 
     await asyncio.gather(
-        stoat_bot.start(),
+        _run_stoat_with_restart(stoat_bot, discord_bot),
+        _stoat_watchdog(discord_bot),
+        _deleting_gc(),
         discord_bot.start(DISCORD_BOT_TOKEN),
     )
 
 
 if __name__ == "__main__":
+    try:
+        # Optional: uvloop is a drop-in libuv event loop – a solid throughput
+        # win on the socket-heavy WebSocket/HTTP workload of the bridge.
+        # Not available on Windows; falls back to the default loop.
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Bridge stopped")
+    finally:
+        # The debounced save may still be pending – don't lose it on shutdown.
+        # (The task object is useless here: asyncio.run() already cancelled it
+        # during teardown, so done() is always True by now.)
+        if _notified_dirty:
+            _write_notified_users(_notified_snapshot())